@@ -1,17 +1,30 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
+import bisect
 import datetime as dt
+import functools
+import hashlib
+import heapq
 import json
+import os
 import re
 import sys
 from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 import sqlite3
-import html
+import io
 
+import aiohttp
 import feedparser
-import requests
+
+try:  # optional: DFA matcher for the tokenizer hot path
+    import re2
+except ImportError:
+    re2 = re
 
 DEFAULT_SOURCES = [
     {
@@ -36,19 +49,36 @@ DEFAULT_SOURCES = [
     },
 ]
 
-STOPWORDS = set(
+STOPWORDS = frozenset(
     "a an the and or but if while of to in on for with without by as is are was were be been "
     "this that these those from at it its into over under about after before between not no "
     "you your we our they their i me my us he she him her them his hers ours theirs"
     .split()
 )
 
-POS_WORDS = set(
+POS_WORDS = frozenset(
     "beat beats growth strong stronger surge surges record optimistic upgrade upgraded buy outperform".split()
 )
-NEG_WORDS = set(
+NEG_WORDS = frozenset(
     "miss misses decline weak weaker plunge plunges downgrade downgraded sell underperform".split()
 )
+# +1 / -1 per lexicon word so sentiment is a single lookup per token
+_POLARITY = {**{w: 1 for w in POS_WORDS}, **{w: -1 for w in NEG_WORDS}}
+
+_WS_RE = re.compile(r"\s+")
+_WORD_RE = re2.compile(r"[a-zA-Z']+")
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+# Same replacements as html.escape(quote=True), done in one str.translate pass
+_HTML_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+
+@dataclass(slots=True)
+class Item:
+    source: str
+    title: str
+    link: str
+    summary: str
+    published: str
 
 
 def load_sources(path: Path, ticker: str, query: str) -> List[Dict[str, str]]:
@@ -66,76 +96,102 @@ def load_sources(path: Path, ticker: str, query: str) -> List[Dict[str, str]]:
     return rendered
 
 
-def fetch_feed(url: str) -> feedparser.FeedParserDict:
+FETCH_RETRIES = 2
+FETCH_BACKOFF = 0.3
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+async def fetch_feed_async(session: aiohttp.ClientSession, url: str) -> feedparser.FeedParserDict:
     # Some feeds block default User-Agent
     headers = {"User-Agent": "news-collector/1.0"}
-    resp = requests.get(url, headers=headers, timeout=20)
-    resp.raise_for_status()
-    return feedparser.parse(resp.text)
+    for attempt in range(FETCH_RETRIES + 1):
+        last = attempt == FETCH_RETRIES
+        try:
+            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=20)) as resp:
+                if last or resp.status not in RETRY_STATUSES:
+                    resp.raise_for_status()
+                    # Hand feedparser the raw bytes plus Content-Type; it sniffs the
+                    # encoding itself, so skip aiohttp's decode pass.
+                    body = await resp.read()
+                    return feedparser.parse(
+                        body,
+                        response_headers={"content-type": resp.headers.get("Content-Type", "")},
+                    )
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if last:
+                raise
+        await asyncio.sleep(FETCH_BACKOFF * 2 ** attempt)
+
+
+async def collect_all(sources: List[Dict[str, str]]) -> List[object]:
+    # One keep-alive session for every feed so same-host sources reuse pooled
+    # connections; results come back in config order, failures as exceptions.
+    connector = aiohttp.TCPConnector(limit=16, limit_per_host=16)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        return await asyncio.gather(
+            *(fetch_feed_async(session, s["url"]) for s in sources),
+            return_exceptions=True,
+        )
 
 
 def normalize_text(text: str) -> str:
-    text = re.sub(r"\s+", " ", text or "").strip()
-    return text
+    return _WS_RE.sub(" ", text or "").strip()
 
 
-def extract_items(feed: feedparser.FeedParserDict, source_name: str) -> List[Dict[str, str]]:
+def extract_items(feed: feedparser.FeedParserDict, source_name: str) -> List[Item]:
     items = []
+    _norm = normalize_text
     for e in feed.entries:
-        title = normalize_text(getattr(e, "title", ""))
-        link = getattr(e, "link", "")
-        summary = normalize_text(getattr(e, "summary", ""))
-        published = normalize_text(getattr(e, "published", ""))
+        title = _norm(e.get("title", ""))
+        link = e.get("link", "")
+        summary = _norm(e.get("summary", ""))
+        published = _norm(e.get("published", ""))
         if not title and not summary:
             continue
-        items.append({
-            "source": source_name,
-            "title": title,
-            "link": link,
-            "summary": summary,
-            "published": published,
-        })
+        items.append(Item(source_name, title, link, summary, published))
     return items
 
 
-def dedupe(items: List[Dict[str, str]]) -> List[Dict[str, str]]:
-    seen = set()
-    out = []
+_TRACKING_PARAMS = frozenset({"gclid", "fbclid"})
+
+
+def _canon(url: str) -> str:
+    # Drop tracking params and case-fold scheme/host so mirrored links compare equal
+    try:
+        p = urlsplit(url)
+    except ValueError:
+        # Malformed feed link (e.g. broken IPv6 host): key on the raw string
+        return url
+    q = [
+        (k, v) for k, v in parse_qsl(p.query, keep_blank_values=True)
+        if not k.startswith(("utm_", "ga_")) and k not in _TRACKING_PARAMS
+    ]
+    return urlunsplit((p.scheme.lower(), p.netloc.lower(), p.path, urlencode(q), ""))
+
+
+def dedupe(items: List[Item]) -> List[Item]:
+    # Insertion-ordered dict; setdefault keeps the first item seen per key
+    seen = {}
     for it in items:
-        key = it.get("link") or it.get("title")
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(it)
-    return out
+        key = hashlib.blake2s(_canon(it.link).encode(), digest_size=8).digest() if it.link else it.title
+        seen.setdefault(key, it)
+    return list(seen.values())
 
 
-def tokenize(text: str) -> List[str]:
-    words = re.findall(r"[a-zA-Z']+", text.lower())
-    return [w for w in words if w not in STOPWORDS and len(w) > 2]
+# Pure function of its input; the same wire story shows up across sources and days
+@functools.lru_cache(maxsize=4096)
+def tokenize(text: str) -> Tuple[str, ...]:
+    return tuple(w for w in _WORD_RE.findall(text.lower()) if w not in STOPWORDS and len(w) > 2)
 
 
-def summarize_text(text: str, max_sentences: int = 3) -> str:
+def _summarize_presplit(sentences: List[str], tokens_per_sent: List[Tuple[str, ...]], freq: Counter, max_sentences: int = 3) -> str:
     # Simple extractive summary: pick top sentences by word frequency
-    sentences = re.split(r"(?<=[.!?])\s+", text)
-    if len(sentences) <= max_sentences:
-        return text.strip()
-    words = tokenize(text)
-    freq = Counter(words)
-    scored = []
-    for s in sentences:
-        score = sum(freq[w] for w in tokenize(s))
-        scored.append((score, s))
-    top = [s for _, s in sorted(scored, reverse=True)[:max_sentences]]
+    scored = [(sum(freq[w] for w in toks), s) for toks, s in zip(tokens_per_sent, sentences)]
+    top = [s for _, s in heapq.nlargest(max_sentences, scored)]
     return " ".join([t.strip() for t in top if t.strip()])
 
 
-def sentiment_score(texts: List[str]) -> Dict[str, int]:
-    score = 0
-    for t in texts:
-        words = tokenize(t)
-        score += sum(1 for w in words if w in POS_WORDS)
-        score -= sum(1 for w in words if w in NEG_WORDS)
+def _sentiment_label(score: int) -> Dict[str, int]:
     label = "neutral"
     if score >= 2:
         label = "bullish"
@@ -144,9 +200,23 @@ def sentiment_score(texts: List[str]) -> Dict[str, int]:
     return {"score": score, "label": label}
 
 
+def sentiment_score(texts: List[str]) -> Dict[str, int]:
+    score = 0
+    for t in texts:
+        for w in tokenize(t):
+            score += _POLARITY.get(w, 0)
+    return _sentiment_label(score)
+
+
 def init_db(db_path: Path) -> sqlite3.Connection:
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
+    # Autocommit mode: store_items opens its own explicit transaction
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    # WAL + NORMAL sync: one fsync per transaction instead of per page write
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS news_items (
@@ -163,136 +233,157 @@ def init_db(db_path: Path) -> sqlite3.Connection:
     return conn
 
 
-def store_items(conn: sqlite3.Connection, items: List[Dict[str, str]], fetched_at: str) -> None:
+_INSERT_SQL = """
+    INSERT INTO news_items
+        (source, title, link, summary, published, fetched_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(link) DO NOTHING
+"""
+
+
+def store_items(conn: sqlite3.Connection, items: List[Item], fetched_at: str) -> None:
     if not items:
         return
-    rows = [
-        (
-            i.get("source"),
-            i.get("title"),
-            i.get("link"),
-            i.get("summary"),
-            i.get("published"),
-            fetched_at,
-        )
-        for i in items
-    ]
-    conn.executemany(
-        """
-        INSERT OR IGNORE INTO news_items
-            (source, title, link, summary, published, fetched_at)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        rows,
-    )
-    conn.commit()
-
-
-def build_summary_sentiment(items: List[Dict[str, str]]) -> Dict[str, object]:
-    combined = " ".join([f"{i['title']}. {i['summary']}" for i in items])
-    summary = summarize_text(combined, max_sentences=3) if combined else "No items found."
-    sentiment = sentiment_score([i["title"] + " " + i["summary"] for i in items])
-    return {"summary": summary, "sentiment": sentiment}
-
-def render_report(date: str, ticker: str, items: List[Dict[str, str]], summary: str, sentiment: Dict[str, int], errors: List[str]) -> str:
-    lines = []
-    lines.append(f"# {ticker} Daily News Summary")
-    lines.append("")
-    lines.append(f"Date: {date}")
-    lines.append("")
-    lines.append("## Summary")
-    lines.append(summary)
-    lines.append("")
-    lines.append(f"Items: {len(items)}")
-    lines.append("")
-    lines.append("## Sentiment (non-predictive)")
-    lines.append(f"Label: {sentiment['label']}")
-    lines.append(f"Score: {sentiment['score']}")
-    lines.append("")
+    rows = [(i.source, i.title, i.link, i.summary, i.published, fetched_at) for i in items]
+    # Single write transaction for the whole batch; `with conn` commits or rolls back
+    with conn:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(_INSERT_SQL, rows)
+
+
+def build_summary_sentiment(items: List[Item]) -> Dict[str, object]:
+    if not items:
+        return {"summary": "No items found.", "sentiment": _sentiment_label(0)}
+    max_sentences = 3
+    if len(items) <= max_sentences:
+        # Slow news day: the headlines are the summary, skip sentence scoring.
+        # extract_items keeps untitled entries that have a summary, so use that instead.
+        heads = [i.title or i.summary for i in items]
+        summary = " ".join(t if t.endswith((".", "!", "?")) else t + "." for t in heads)
+        return {"summary": summary, "sentiment": sentiment_score([f"{i.title} {i.summary}" for i in items])}
+    # One tokenization pass feeds both the summary scoring and the sentiment count
+    sentences = []
+    tokens_per_sent = []
+    freq = Counter()
+    score = 0
+    for i in items:
+        for s in _SENT_RE.split(f"{i.title}. {i.summary}"):
+            s = s.strip()
+            if not s:
+                continue
+            toks = tokenize(s)
+            sentences.append(s)
+            tokens_per_sent.append(toks)
+            freq.update(toks)
+            for w in toks:
+                score += _POLARITY.get(w, 0)
+    summary = _summarize_presplit(sentences, tokens_per_sent, freq, max_sentences)
+    return {"summary": summary, "sentiment": _sentiment_label(score)}
+
+
+def render_report(date: str, ticker: str, items: List[Item], summary: str, sentiment: Dict[str, int], errors: List[str]) -> str:
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# {ticker} Daily News Summary\n")
+    w("\n")
+    w(f"Date: {date}\n")
+    w("\n")
+    w("## Summary\n")
+    w(summary)
+    w("\n")
+    w("\n")
+    w(f"Items: {len(items)}\n")
+    w("\n")
+    w("## Sentiment (non-predictive)\n")
+    w(f"Label: {sentiment['label']}\n")
+    w(f"Score: {sentiment['score']}\n")
+    w("\n")
     if errors:
-        lines.append("## Fetch Errors")
+        w("## Fetch Errors\n")
         for e in errors:
-            lines.append(f"- {e}")
-        lines.append("")
-    lines.append("## Articles")
+            w(f"- {e}\n")
+        w("\n")
+    w("## Articles\n")
     if not items:
-        lines.append("No articles found.")
+        w("No articles found.\n")
     else:
         for it in items:
-            lines.append(f"- {it['title']}")
-            if it.get("published"):
-                lines.append(f"  Published: {it['published']}")
-            if it.get("link"):
-                lines.append(f"  Link: {it['link']}")
-            if it.get("summary"):
-                lines.append(f"  Summary: {it['summary']}")
-    return "\n".join(lines)
-
-
-def render_html_report(date: str, ticker: str, items: List[Dict[str, str]], summary: str, sentiment: Dict[str, int], errors: List[str]) -> str:
-    def esc(s: str) -> str:
-        return html.escape(s or "")
-
-    lines = []
-    lines.append("<!doctype html>")
-    lines.append("<html lang=\"en\">")
-    lines.append("<head>")
-    lines.append("<meta charset=\"utf-8\">")
-    lines.append("<meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">")
-    lines.append(f"<title>{esc(ticker)} Daily News Summary</title>")
-    lines.append("<style>")
-    lines.append("body{font-family:system-ui, -apple-system, Segoe UI, Roboto, sans-serif; margin:40px; color:#111;}")
-    lines.append("h1{margin-bottom:4px;} .meta{color:#555; margin-bottom:20px;}")
-    lines.append(".card{border:1px solid #ddd; padding:16px; border-radius:8px; margin-bottom:16px;}")
-    lines.append("a{color:#0b57d0; text-decoration:none;} a:hover{text-decoration:underline;}")
-    lines.append("</style>")
-    lines.append("</head>")
-    lines.append("<body>")
-    lines.append(f"<h1>{esc(ticker)} Daily News Summary</h1>")
-    lines.append(f"<div class=\"meta\">Date: {esc(date)} • Items: {len(items)}</div>")
-    lines.append("<div class=\"card\">")
-    lines.append("<h2>Summary</h2>")
-    lines.append(f"<p>{esc(summary)}</p>")
-    lines.append("</div>")
-    lines.append("<div class=\"card\">")
-    lines.append("<h2>Sentiment (non-predictive)</h2>")
-    lines.append(f"<p>Label: {esc(sentiment['label'])} • Score: {sentiment['score']}</p>")
-    lines.append("</div>")
+            w(f"- {it.title}\n")
+            if it.published:
+                w(f"  Published: {it.published}\n")
+            if it.link:
+                w(f"  Link: {it.link}\n")
+            if it.summary:
+                w(f"  Summary: {it.summary}\n")
+    return buf.getvalue()
+
+
+def _esc(s: str) -> str:
+    return (s or "").translate(_HTML_ESC)
+
+
+def render_html_report(date: str, ticker: str, items: List[Item], summary: str, sentiment: Dict[str, int], errors: List[str]) -> str:
+    buf = io.StringIO()
+    w = buf.write
+    w("<!doctype html>\n")
+    w("<html lang=\"en\">\n")
+    w("<head>\n")
+    w("<meta charset=\"utf-8\">\n")
+    w("<meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">\n")
+    w(f"<title>{_esc(ticker)} Daily News Summary</title>\n")
+    w("<style>\n")
+    w("body{font-family:system-ui, -apple-system, Segoe UI, Roboto, sans-serif; margin:40px; color:#111;}\n")
+    w("h1{margin-bottom:4px;} .meta{color:#555; margin-bottom:20px;}\n")
+    w(".card{border:1px solid #ddd; padding:16px; border-radius:8px; margin-bottom:16px;}\n")
+    w("a{color:#0b57d0; text-decoration:none;} a:hover{text-decoration:underline;}\n")
+    w("</style>\n")
+    w("</head>\n")
+    w("<body>\n")
+    w(f"<h1>{_esc(ticker)} Daily News Summary</h1>\n")
+    w(f"<div class=\"meta\">Date: {_esc(date)} • Items: {len(items)}</div>\n")
+    w("<div class=\"card\">\n")
+    w("<h2>Summary</h2>\n")
+    w(f"<p>{_esc(summary)}</p>\n")
+    w("</div>\n")
+    w("<div class=\"card\">\n")
+    w("<h2>Sentiment (non-predictive)</h2>\n")
+    w(f"<p>Label: {_esc(sentiment['label'])} • Score: {sentiment['score']}</p>\n")
+    w("</div>\n")
     if errors:
-        lines.append("<div class=\"card\">")
-        lines.append("<h2>Fetch Errors</h2>")
-        lines.append("<ul>")
+        w("<div class=\"card\">\n")
+        w("<h2>Fetch Errors</h2>\n")
+        w("<ul>\n")
         for e in errors:
-            lines.append(f"<li>{esc(e)}</li>")
-        lines.append("</ul>")
-        lines.append("</div>")
-    lines.append("<div class=\"card\">")
-    lines.append("<h2>Articles</h2>")
+            w(f"<li>{_esc(e)}</li>\n")
+        w("</ul>\n")
+        w("</div>\n")
+    w("<div class=\"card\">\n")
+    w("<h2>Articles</h2>\n")
     if not items:
-        lines.append("<p>No articles found.</p>")
+        w("<p>No articles found.</p>\n")
     else:
-        lines.append("<ul>")
+        w("<ul>\n")
         for it in items:
-            title = esc(it.get("title", ""))
-            link = esc(it.get("link", ""))
-            published = esc(it.get("published", ""))
-            summary_it = esc(it.get("summary", ""))
+            title = _esc(it.title)
+            link = _esc(it.link)
+            published = _esc(it.published)
+            summary_it = _esc(it.summary)
             if link:
-                lines.append(f"<li><a href=\"{link}\">{title}</a></li>")
+                w(f"<li><a href=\"{link}\">{title}</a></li>\n")
             else:
-                lines.append(f"<li>{title}</li>")
+                w(f"<li>{title}</li>\n")
             if published:
-                lines.append(f"<div class=\"meta\">Published: {published}</div>")
+                w(f"<div class=\"meta\">Published: {published}</div>\n")
             if summary_it:
-                lines.append(f"<div>{summary_it}</div>")
-        lines.append("</ul>")
-    lines.append("</div>")
-    lines.append("</body>")
-    lines.append("</html>")
-    return "\n".join(lines)
+                w(f"<div>{summary_it}</div>\n")
+        w("</ul>\n")
+    w("</div>\n")
+    w("</body>\n")
+    w("</html>\n")
+    return buf.getvalue()
 
 
-def write_site(site_dir: Path, date: str, ticker: str, items: List[Dict[str, str]], summary: str, sentiment: Dict[str, int], errors: List[str], cname: str) -> None:
+def write_site(site_dir: Path, date: str, ticker: str, items: List[Item], summary: str, sentiment: Dict[str, int], errors: List[str], cname: str) -> None:
     site_dir.mkdir(parents=True, exist_ok=True)
     archive_dir = site_dir / "archive"
     archive_dir.mkdir(parents=True, exist_ok=True)
@@ -300,26 +391,47 @@ def write_site(site_dir: Path, date: str, ticker: str, items: List[Dict[str, str
     html_report = render_html_report(date, ticker, items, summary, sentiment, errors)
     latest_path = site_dir / "index.html"
     archive_path = archive_dir / f"{date}.html"
-    latest_path.write_text(html_report)
-    archive_path.write_text(html_report)
-
-    # Build archive index
-    archive_files = sorted(archive_dir.glob("*.html"), reverse=True)
-    lines = []
-    lines.append("<!doctype html>")
-    lines.append("<html lang=\"en\">")
-    lines.append("<head><meta charset=\"utf-8\"><meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">")
-    lines.append(f"<title>{html.escape(ticker)} Report Archive</title></head>")
-    lines.append("<body>")
-    lines.append(f"<h1>{html.escape(ticker)} Report Archive</h1>")
-    lines.append("<ul>")
-    for f in archive_files:
-        day = f.stem
-        rel = f"archive/{f.name}"
-        lines.append(f"<li><a href=\"{rel}\">{html.escape(day)}</a></li>")
-    lines.append("</ul>")
-    lines.append("</body></html>")
-    (site_dir / "archive.html").write_text("\n".join(lines))
+    # Encode once; both pages get identical bytes
+    data = html_report.encode("utf-8")
+    latest_path.write_bytes(data)
+    archive_path.write_bytes(data)
+
+    # Archive index: sorted date list kept in a sidecar so a run only inserts
+    # its own date; the directory scan is just a rebuild when it is missing
+    # or unreadable.
+    index_path = site_dir / "archive_index.json"
+    days = None
+    if index_path.exists():
+        try:
+            days = json.loads(index_path.read_text())
+        except ValueError:
+            days = None
+        if not isinstance(days, list) or not all(isinstance(d, str) for d in days):
+            days = None
+        elif date not in days:
+            bisect.insort(days, date)
+    if days is None:
+        days = sorted(f.stem for f in archive_dir.glob("*.html"))
+    # Write-then-rename so an interrupted run never leaves a truncated sidecar
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(days))
+    os.replace(tmp_path, index_path)
+
+    buf = io.StringIO()
+    w = buf.write
+    w("<!doctype html>\n")
+    w("<html lang=\"en\">\n")
+    w("<head><meta charset=\"utf-8\"><meta name=\"viewport\" content=\"width=device-width, initial-scale=1\">\n")
+    w(f"<title>{_esc(ticker)} Report Archive</title></head>\n")
+    w("<body>\n")
+    w(f"<h1>{_esc(ticker)} Report Archive</h1>\n")
+    w("<ul>\n")
+    for day in reversed(days):
+        rel = f"archive/{day}.html"
+        w(f"<li><a href=\"{rel}\">{_esc(day)}</a></li>\n")
+    w("</ul>\n")
+    w("</body></html>\n")
+    (site_dir / "archive.html").write_text(buf.getvalue())
     if cname:
         (site_dir / "CNAME").write_text(cname.strip() + "\n")
 
@@ -342,15 +454,18 @@ def main() -> int:
 
     all_items = []
     errors = []
-    for s in sources:
+    feeds = asyncio.run(collect_all(sources))
+    for s, feed in zip(sources, feeds):
         try:
-            feed = fetch_feed(s["url"])
+            if isinstance(feed, BaseException):
+                raise feed
             items = extract_items(feed, s["name"])
             all_items.extend(items)
         except Exception as e:
-            msg = f"{s['name']}: {e}"
-            errors.append(msg)
-            print(f"WARN: failed to fetch {msg}", file=sys.stderr)
+            errors.append(f"{s['name']}: {str(e) or type(e).__name__}")
+    # Report failures in one block once every source has been handled
+    for msg in errors:
+        print(f"WARN: failed to fetch {msg}", file=sys.stderr)
 
     items = dedupe(all_items)
     fetched_at = dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"